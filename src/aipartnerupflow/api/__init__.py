@@ -35,7 +35,8 @@ def setup_app(
     Args:
         protocol: Protocol type ("a2a", "mcp", etc.). Default: "a2a"
         auto_initialize_extensions: If True, automatically initialize all extensions
-                                   before creating the app (default: True)
+                                   before creating the app (default: True).
+                                   Pass False if initialize_extensions() was already called.
         load_custom_task_model: If True, load custom TaskModel from environment variable
                                AIPARTNERUPFLOW_TASK_MODEL_CLASS (default: True)
         custom_routes: Optional list of custom Starlette Route objects
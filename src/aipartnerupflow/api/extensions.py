@@ -6,6 +6,7 @@ Extensions are automatically detected based on installed dependencies.
 """
 
 import os
+from functools import cache
 from typing import Any, Optional
 
 from aipartnerupflow.core.utils.logger import get_logger
@@ -69,6 +70,7 @@ EXTENSION_CONFIG: dict[str, dict[str, Any]] = {
 }
 
 
+@cache
 def _is_package_installed(package_name: str) -> bool:
     """
     Check if a package is installed using importlib.metadata
@@ -76,6 +78,10 @@ def _is_package_installed(package_name: str) -> bool:
     For standard library packages, this function tries to import them directly.
     For third-party packages, it checks installed distributions.
 
+    Results are cached for the lifetime of the process: a missing package
+    requires a scan of all installed distributions, which would otherwise be
+    repeated on every initialize_extensions() call.
+
     This function handles various import-related errors, including:
     - ImportError: Package not installed
     - ModuleNotFoundError: Package not found (Python 3.6+)
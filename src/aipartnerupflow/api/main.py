@@ -14,17 +14,18 @@ Protocol selection via AIPARTNERUPFLOW_API_PROTOCOL environment variable:
 """
 
 import os
+import re
 import sys
 import time
-import uvicorn
 import warnings
+from contextlib import contextmanager
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from aipartnerupflow.api.app import create_app_by_protocol
 from aipartnerupflow.api.extensions import initialize_extensions, _load_custom_task_model
 from aipartnerupflow.api.protocols import get_protocol_from_env
-from aipartnerupflow.core.storage.factory import get_default_session
 from aipartnerupflow.core.utils.logger import get_logger
 
 # Initialize logger early
@@ -33,6 +34,77 @@ logger = get_logger(__name__)
 # Global start time for measuring initialization duration
 _start_time: Optional[float] = None
 
+# Environment variables consulted by main() when resolving server configuration.
+# They are snapshotted once (after .env loading) instead of walking os.environ
+# for every fallback in the lookup chains.
+_STARTUP_ENV_KEYS = (
+    "AIPARTNERUPFLOW_API_HOST",
+    "API_HOST",
+    "AIPARTNERUPFLOW_API_PORT",
+    "API_PORT",
+    "AIPARTNERUPFLOW_ACCESS_LOG",
+    "AIPARTNERUPFLOW_MAX_CONCURRENCY",
+)
+
+# Snapshot of _STARTUP_ENV_KEYS, populated by _get_startup_env()
+_env_cache: Optional[Dict[str, Optional[str]]] = None
+
+# Marks a main() option that was not passed, as None is a meaningful uvicorn value
+_UNSET = object()
+
+# Warnings suppressed in development mode: (category, module regex)
+_DEV_IGNORED_WARNINGS = (
+    (SyntaxWarning, "pysbd"),
+    (DeprecationWarning, "websockets"),
+    (DeprecationWarning, "uvicorn"),
+)
+
+# (phase name, duration in ms) for each step of the last create_runnable_app() call
+_startup_phases: List[Tuple[str, float]] = []
+
+
+def _get_startup_env(refresh: bool = False) -> Dict[str, Optional[str]]:
+    """
+    Get a snapshot of the environment variables used during startup
+    
+    The snapshot is taken on first use and reused afterwards. Pass refresh=True
+    after loading a .env file so newly loaded values are picked up.
+    
+    Args:
+        refresh: Re-read the variables from os.environ
+        
+    Returns:
+        Dictionary mapping each key in _STARTUP_ENV_KEYS to its value (or None)
+    """
+    global _env_cache
+    if _env_cache is None or refresh:
+        environ = os.environ
+        _env_cache = {key: environ.get(key) for key in _STARTUP_ENV_KEYS}
+    return _env_cache
+
+
+@contextmanager
+def _phase(name: str) -> Iterator[None]:
+    """
+    Record the wall-clock duration of a startup phase in _startup_phases
+    
+    Args:
+        name: Phase name shown in the startup summary
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _startup_phases.append((name, (time.perf_counter_ns() - start) / 1_000_000))
+
+
+def _log_startup_phases() -> None:
+    """Log the recorded startup phases, slowest first"""
+    if not _startup_phases:
+        return
+    lines = [f"  {name:<14} {duration:9.1f} ms" for name, duration in sorted(_startup_phases, key=lambda p: -p[1])]
+    logger.info("Startup phases:\n" + "\n".join(lines))
+
 
 def _load_env_file():
     """
@@ -46,10 +118,15 @@ def _load_env_file():
     This ensures that when used as a library, it loads .env from the calling project,
     not from the library's installation directory.
     """
+    # Probe with find_spec first, so a missing python-dotenv costs no
+    # exception/traceback on every cold start
+    if find_spec("dotenv") is None:
+        # python-dotenv not installed, skip .env loading
+        return
     try:
         from dotenv import load_dotenv
     except ImportError:
-        # python-dotenv not installed, skip .env loading
+        # A "dotenv" module that is not python-dotenv (or is broken), skip .env loading
         return
     
     possible_paths = []
@@ -85,14 +162,17 @@ def _load_env_file():
     
     # Try each path and load the first one that exists
     for env_path in possible_paths:
-        if env_path.exists():
-            try:
-                load_dotenv(env_path, override=False)  # override=False to respect existing env vars
-                logger.debug(f"Loaded .env file from {env_path}")
-                return
-            except Exception as e:
-                logger.debug(f"Failed to load .env from {env_path}: {e}")
-                continue
+        try:
+            env_path.stat()
+        except OSError:
+            continue  # Does not exist or is not accessible
+        try:
+            load_dotenv(env_path, override=False)  # override=False to respect existing env vars
+            logger.debug(f"Loaded .env file from {env_path}")
+            return
+        except Exception as e:
+            logger.debug(f"Failed to load .env from {env_path}: {e}")
+            continue
 
 
 def _setup_development_environment():
@@ -101,7 +181,7 @@ def _setup_development_environment():
     
     This includes:
     - Suppressing specific warnings for cleaner output
-    - Adding project root to Python path (for development mode)
+    - Adding project root to Python path (only when executed as __main__)
     
     This should NOT run when used as a library to avoid affecting the calling project.
     """
@@ -117,15 +197,68 @@ def _setup_development_environment():
         return  # Can't determine, skip to be safe
     
     # Suppress specific warnings for cleaner output (only in development)
-    warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
-    warnings.filterwarnings("ignore", category=DeprecationWarning, module="websockets")
-    warnings.filterwarnings("ignore", category=DeprecationWarning, module="uvicorn")
+    # Filters installed by an earlier call are skipped: filterwarnings() would
+    # re-insert them and invalidate every module's warning registry
+    for category, module in _DEV_IGNORED_WARNINGS:
+        if ("ignore", None, category, re.compile(module), 0) not in warnings.filters:
+            warnings.filterwarnings("ignore", category=category, module=module)
     
     # Add project root to Python path for development (only when running directly)
     # This helps when running: python -m aipartnerupflow.api.main
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
+    # Importers (CLI, tests, applications) skip it: mutating sys.path invalidates
+    # importlib's path caches and slows every subsequent import.
+    if __name__ == "__main__":
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        if project_root not in sys.path:
+            sys.path.insert(0, project_root)
+
+
+def _initialize_database() -> None:
+    """
+    Initialize the database connection and create tables if needed
+    
+    Failures are logged and ignored so the server can start even if the
+    database is not available.
+    """
+    try:
+        from sqlalchemy.ext.asyncio import AsyncSession
+        from sqlalchemy import create_engine
+        from aipartnerupflow.core.storage.sqlalchemy.models import Base
+        from aipartnerupflow.core.storage.factory import (
+            _get_database_url_from_env,
+            get_default_session,
+            is_postgresql_url,
+            normalize_postgresql_url,
+        )
+        
+        # Check if DATABASE_URL is set
+        db_url = _get_database_url_from_env()
+        if db_url and is_postgresql_url(db_url):
+            # For PostgreSQL, create tables using sync connection (simpler and more reliable)
+            # Table creation only needs to happen once, so sync mode is fine
+            connection_string = normalize_postgresql_url(db_url, async_mode=False)
+            sync_engine = create_engine(connection_string, echo=False)
+            try:
+                Base.metadata.create_all(sync_engine)
+                logger.info("Database tables created successfully")
+            except Exception as e:
+                logger.warning(f"Could not create tables automatically: {e}")
+            finally:
+                sync_engine.dispose()
+        else:
+            # For DuckDB or when no DATABASE_URL, get_default_session will handle it
+            session = get_default_session()
+            logger.info("Database connection initialized and tables created if needed")
+            # Close the session immediately since we just needed table creation
+            if not isinstance(session, AsyncSession):
+                try:
+                    session.close()
+                except Exception:
+                    pass  # Ignore close errors
+    except Exception as e:
+        # Don't fail startup if database initialization fails
+        # This allows the server to start even if database is not available
+        logger.warning(f"Database initialization skipped: {e}")
 
 
 def create_runnable_app(**kwargs):
@@ -183,8 +316,12 @@ def create_runnable_app(**kwargs):
     if _start_time is None:
         _start_time = time.time()
     
+    _startup_phases.clear()
+
     # Load .env file (from calling project's directory when used as library)
-    _load_env_file()
+    with _phase("env"):
+        _load_env_file()
+        _get_startup_env(refresh=True)
     
     # Setup development environment (only when running library's own main.py directly)
     _setup_development_environment()
@@ -193,68 +330,42 @@ def create_runnable_app(**kwargs):
     
     # Auto-discover built-in extensions (optional, extensions register via @executor_register, @storage_register, @hook_register decorators)
     # This ensures extensions are available when TaskManager is used
+    # The custom TaskModel is loaded once below, so extensions skip loading it
     auto_initialize_extensions = kwargs.pop("auto_initialize_extensions", True)
     if auto_initialize_extensions:
         try:
-            initialize_extensions()
+            with _phase("extensions"):
+                initialize_extensions(load_custom_task_model=False)
         except Exception as e:
             # Don't fail if extension initialization fails
             logger.warning(f"Failed to auto-initialize extensions: {e}")
-    
-    # Log startup time
-    startup_time = time.time() - _start_time
-    logger.info(f"Service initialization completed in {startup_time:.2f} seconds")
 
     # Load custom TaskModel if specified
-    _load_custom_task_model()
+    with _phase("task_model"):
+        _load_custom_task_model()
 
     # Initialize database connection and create tables if needed
     # This ensures tables are created when DATABASE_URL is set
-    try:
-        from sqlalchemy.ext.asyncio import AsyncSession
-        from sqlalchemy import create_engine
-        from aipartnerupflow.core.storage.sqlalchemy.models import Base
-        from aipartnerupflow.core.storage.factory import _get_database_url_from_env, is_postgresql_url, normalize_postgresql_url
-        
-        # Check if DATABASE_URL is set
-        db_url = _get_database_url_from_env()
-        if db_url and is_postgresql_url(db_url):
-            # For PostgreSQL, create tables using sync connection (simpler and more reliable)
-            # Table creation only needs to happen once, so sync mode is fine
-            connection_string = normalize_postgresql_url(db_url, async_mode=False)
-            sync_engine = create_engine(connection_string, echo=False)
-            try:
-                Base.metadata.create_all(sync_engine)
-                logger.info("Database tables created successfully")
-            except Exception as e:
-                logger.warning(f"Could not create tables automatically: {e}")
-            finally:
-                sync_engine.dispose()
-        else:
-            # For DuckDB or when no DATABASE_URL, get_default_session will handle it
-            session = get_default_session()
-            logger.info("Database connection initialized and tables created if needed")
-            # Close the session immediately since we just needed table creation
-            if not isinstance(session, AsyncSession):
-                try:
-                    session.close()
-                except Exception:
-                    pass  # Ignore close errors
-    except Exception as e:
-        # Don't fail startup if database initialization fails
-        # This allows the server to start even if database is not available
-        logger.warning(f"Database initialization skipped: {e}")
+    with _phase("database"):
+        _initialize_database()
+
+    # Log startup time
+    startup_time = time.time() - _start_time
+    logger.info(f"Service initialization completed in {startup_time:.2f} seconds")
 
     # Determine protocol (default to A2A for backward compatibility)
     protocol = kwargs.pop("protocol", None) or get_protocol_from_env()
     logger.info(f"Starting API service with protocol: {protocol}")
 
     # Create app based on protocol (pass remaining kwargs)
-    return create_app_by_protocol(
-        protocol=protocol,
-        auto_initialize_extensions=False,  # Already initialized above if needed
-        **kwargs
-    )
+    with _phase("create_app"):
+        app = create_app_by_protocol(
+            protocol=protocol,
+            auto_initialize_extensions=False,  # Already initialized above if needed
+            **kwargs
+        )
+    _log_startup_phases()
+    return app
 
 
 def main(**kwargs):
@@ -287,10 +398,15 @@ def main(**kwargs):
                 - host: Server host (default: from AIPARTNERUPFLOW_API_HOST or API_HOST env var, or "0.0.0.0")
                 - port: Server port (default: from AIPARTNERUPFLOW_API_PORT or API_PORT env var, or 8000)
                 - workers: Number of worker processes (default: 1)
-                - loop: Event loop type (default: "asyncio")
-                - limit_concurrency: Maximum concurrent connections (default: 100)
-                - limit_max_requests: Maximum requests per worker (default: 1000)
-                - access_log: Enable access logging (default: True)
+                - loop: Event loop type (default: "auto" - uvloop if installed, otherwise asyncio)
+                - limit_concurrency: Maximum concurrent connections (default: from
+                                     AIPARTNERUPFLOW_MAX_CONCURRENCY env var, or
+                                     min(1024, 128 * CPU count); pass None for no limit)
+                - limit_max_requests: Maximum requests before a worker is restarted
+                                      (default: None - workers are not recycled)
+                - access_log: Enable access logging (default: False, or AIPARTNERUPFLOW_ACCESS_LOG=true).
+                              Access logging formats a line per request on the event loop,
+                              so it is off by default for production throughput.
     
     Examples:
         # Basic usage (uses environment variables)
@@ -308,26 +424,49 @@ def main(**kwargs):
         )
     """
     # Extract uvicorn-specific parameters from kwargs (use pop to avoid KeyError)
-    # Use explicit None check to handle 0 as a valid value
     host = kwargs.pop("host", None)
-    if host is None:
-        host = os.getenv("AIPARTNERUPFLOW_API_HOST", os.getenv("API_HOST", "0.0.0.0"))
-    
     port = kwargs.pop("port", None)
-    if port is None:
-        port = int(os.getenv("AIPARTNERUPFLOW_API_PORT", os.getenv("API_PORT", "8000")))
-    else:
-        port = int(port)
-    
     workers = kwargs.pop("workers", 1)
-    loop = kwargs.pop("loop", "asyncio")
-    limit_concurrency = kwargs.pop("limit_concurrency", 100)
-    limit_max_requests = kwargs.pop("limit_max_requests", 1000)
-    access_log = kwargs.pop("access_log", True)
+    # "auto" lets uvicorn pick uvloop (shipped with uvicorn[standard]) and fall back to asyncio
+    loop = kwargs.pop("loop", "auto")
+    limit_concurrency = kwargs.pop("limit_concurrency", _UNSET)
+    limit_max_requests = kwargs.pop("limit_max_requests", None)
+    access_log = kwargs.pop("access_log", None)
     
     # Create app with remaining kwargs (application configuration)
+    # This also loads .env, so host/port fallbacks are resolved afterwards
     app = create_runnable_app(**kwargs)
+    
+    # Use explicit None check to handle 0 as a valid value
+    env = _get_startup_env()
+    if host is None:
+        host = env["AIPARTNERUPFLOW_API_HOST"] or env["API_HOST"] or "0.0.0.0"
+    if port is None:
+        port = env["AIPARTNERUPFLOW_API_PORT"] or env["API_PORT"] or "8000"
+    port = int(port)
+    if access_log is None:
+        access_log = (env["AIPARTNERUPFLOW_ACCESS_LOG"] or "").lower() in ("true", "1", "yes")
+    if limit_concurrency is _UNSET:
+        max_concurrency = env["AIPARTNERUPFLOW_MAX_CONCURRENCY"]
+        if max_concurrency:
+            try:
+                limit_concurrency = int(max_concurrency)
+            except ValueError:
+                limit_concurrency = None
+            if limit_concurrency is None or limit_concurrency <= 0:
+                raise ValueError(
+                    f"Invalid AIPARTNERUPFLOW_MAX_CONCURRENCY: {max_concurrency!r}. "
+                    f"Expected a positive integer number of concurrent connections."
+                )
+        else:
+            limit_concurrency = min(1024, (os.cpu_count() or 1) * 128)
+    elif limit_concurrency is not None:
+        # An explicit None is passed through: it is uvicorn's "no limit"
+        limit_concurrency = int(limit_concurrency)
         
+    # Imported here so that importing this module (e.g. for create_runnable_app) stays light
+    import uvicorn
+
     # Run server
     uvicorn.run(
         app,
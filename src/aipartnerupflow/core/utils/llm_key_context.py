@@ -1,7 +1,7 @@
 """
 LLM Key Context Manager
 
-Provides thread-local context for LLM API keys during task execution.
+Provides per-request context for LLM API keys during task execution.
 Supports multiple sources with configurable priority order:
 - API context: header -> LLMKeyConfigManager -> env
 - CLI context: params -> LLMKeyConfigManager -> env
@@ -11,14 +11,19 @@ but we also support them here for executors that need explicit key passing.
 """
 
 import os
-import threading
+from contextvars import ContextVar
 from typing import Optional, Literal, Callable
 from aipartnerupflow.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Thread-local storage for LLM key context
-_context = threading.local()
+# Context-local storage for LLM key context
+# ContextVar (rather than threading.local) keeps keys isolated between
+# concurrent requests served by the same event loop thread
+_llm_key_header: ContextVar[Optional[str]] = ContextVar("llm_key_header", default=None)
+_llm_provider_header: ContextVar[Optional[str]] = ContextVar("llm_provider_header", default=None)
+_llm_key_cli: ContextVar[Optional[str]] = ContextVar("llm_key_cli", default=None)
+_llm_provider_cli: ContextVar[Optional[str]] = ContextVar("llm_provider_cli", default=None)
 
 
 def set_llm_key_from_header(api_key: Optional[str], provider: Optional[str] = None) -> None:
@@ -29,9 +34,9 @@ def set_llm_key_from_header(api_key: Optional[str], provider: Optional[str] = No
         api_key: LLM API key from request header
         provider: Optional provider name from request header
     """
-    _context.llm_key_header = api_key
+    _llm_key_header.set(api_key)
     if provider:
-        _context.llm_provider_header = provider
+        _llm_provider_header.set(provider)
     if api_key:
         logger.debug(f"Set LLM key from request header (provider: {provider or 'auto'})")
 
@@ -43,7 +48,7 @@ def get_llm_key_from_header() -> Optional[str]:
     Returns:
         LLM API key if set, None otherwise
     """
-    return getattr(_context, 'llm_key_header', None)
+    return _llm_key_header.get()
 
 
 def get_llm_provider_from_header() -> Optional[str]:
@@ -53,7 +58,7 @@ def get_llm_provider_from_header() -> Optional[str]:
     Returns:
         LLM provider name if set, None otherwise
     """
-    return getattr(_context, 'llm_provider_header', None)
+    return _llm_provider_header.get()
 
 
 def set_llm_key_from_cli_params(api_key: Optional[str], provider: Optional[str] = None) -> None:
@@ -64,9 +69,9 @@ def set_llm_key_from_cli_params(api_key: Optional[str], provider: Optional[str]
         api_key: LLM API key from CLI params
         provider: Optional provider name from CLI params
     """
-    _context.llm_key_cli = api_key
+    _llm_key_cli.set(api_key)
     if provider:
-        _context.llm_provider_cli = provider
+        _llm_provider_cli.set(provider)
     if api_key:
         logger.debug(f"Set LLM key from CLI params (provider: {provider or 'auto'})")
 
@@ -78,7 +83,7 @@ def get_llm_key_from_cli_params() -> Optional[str]:
     Returns:
         LLM API key if set, None otherwise
     """
-    return getattr(_context, 'llm_key_cli', None)
+    return _llm_key_cli.get()
 
 
 def get_llm_provider_from_cli_params() -> Optional[str]:
@@ -88,7 +93,7 @@ def get_llm_provider_from_cli_params() -> Optional[str]:
     Returns:
         LLM provider name if set, None otherwise
     """
-    return getattr(_context, 'llm_provider_cli', None)
+    return _llm_provider_cli.get()
 
 
 def _get_key_from_user_config(user_id: str, provider: Optional[str] = None) -> Optional[str]:
@@ -258,12 +263,8 @@ def clear_llm_key_context() -> None:
     This should be called at the start of each request/execution
     to prevent using stale keys from previous requests.
     """
-    if hasattr(_context, 'llm_key_header'):
-        delattr(_context, 'llm_key_header')
-    if hasattr(_context, 'llm_provider_header'):
-        delattr(_context, 'llm_provider_header')
-    if hasattr(_context, 'llm_key_cli'):
-        delattr(_context, 'llm_key_cli')
-    if hasattr(_context, 'llm_provider_cli'):
-        delattr(_context, 'llm_provider_cli')
+    _llm_key_header.set(None)
+    _llm_provider_header.set(None)
+    _llm_key_cli.set(None)
+    _llm_provider_cli.set(None)
 
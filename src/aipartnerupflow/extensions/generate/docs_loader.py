@@ -5,6 +5,9 @@ This module loads and formats framework documentation for LLM context
 when generating task trees.
 """
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from aipartnerupflow.core.utils.logger import get_logger
 
@@ -12,9 +15,36 @@ logger = get_logger(__name__)
 
 # Get the project root directory (assuming this file is in src/aipartnerupflow/extensions/generate/)
 # Go up from this file: generate/ -> extensions/ -> aipartnerupflow/ -> src/ -> project root
-_PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+_PROJECT_ROOT = Path(__file__).parents[4]
 _DOCS_DIR = _PROJECT_ROOT / "docs"
 
+# Lines of the orchestration guide that start the "key rules" excerpt in load_all_docs()
+_KEY_RULES_RE = re.compile(r'parent_id|dependencies|execution order', re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _read_doc_file_cached(path: str, mtime_ns: int) -> str:
+    """
+    Read a documentation file, cached per (path, mtime_ns)
+    
+    Including the modification time in the cache key means an edited file
+    is re-read on the next call while unchanged files are served from memory.
+    
+    Args:
+        path: Absolute file path
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        
+    Returns:
+        File contents as string
+    """
+    # Reading bytes and decoding once avoids the text-mode wrapper overhead
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8')
+    # Match text-mode newline translation (e.g. CRLF checkouts on Windows)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
 
 def _read_doc_file(relative_path: str) -> str:
     """
@@ -28,11 +58,13 @@ def _read_doc_file(relative_path: str) -> str:
     """
     file_path = _DOCS_DIR / relative_path
     try:
-        if file_path.exists() and file_path.is_file():
-            return file_path.read_text(encoding='utf-8')
-        else:
-            logger.warning(f"Documentation file not found: {file_path}")
-            return ""
+        # stat() only provides the cache key; missing files and directories
+        # surface as errors from stat()/open() rather than separate checks
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        return _read_doc_file_cached(str(file_path), mtime_ns)
+    except (FileNotFoundError, IsADirectoryError):
+        logger.warning(f"Documentation file not found: {file_path}")
+        return ""
     except Exception as e:
         logger.error(f"Error reading documentation file {file_path}: {e}")
         return ""
@@ -122,6 +154,7 @@ def _extract_relevant_sections(text: str, keywords: list, max_chars: int = 2000)
     
     lines = text.split('\n')
     relevant_lines = []
+    relevant_len = -1  # len('\n'.join(relevant_lines)) once non-empty, maintained incrementally
     current_section = []
     in_relevant_section = False
     
@@ -138,16 +171,19 @@ def _extract_relevant_sections(text: str, keywords: list, max_chars: int = 2000)
             # Add current section if it exists
             if current_section:
                 relevant_lines.extend(current_section)
+                relevant_len += sum(len(l) + 1 for l in current_section)
                 current_section = []
             relevant_lines.append(line)
+            relevant_len += len(line) + 1
         elif in_relevant_section:
             # Continue collecting lines in relevant section
             if line.strip():
                 relevant_lines.append(line)
+                relevant_len += len(line) + 1
             else:
                 # Empty line might indicate section end, but keep collecting
                 current_section.append(line)
-                if len('\n'.join(relevant_lines)) > max_chars * 0.8:
+                if relevant_len > max_chars * 0.8:
                     break
         elif line.strip().startswith('#') or line.strip().startswith('##'):
             # New section header, reset
@@ -215,11 +251,44 @@ def load_relevant_docs_for_requirement(requirement: str, max_chars_per_section:
         Relevant documentation content
     """
     keywords = _extract_keywords_from_requirement(requirement)
+    return _build_relevant_docs(
+        tuple(keywords),
+        load_task_orchestration_docs(),
+        load_task_examples(),
+        load_concepts(),
+        max_chars_per_section,
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_relevant_docs(
+    keywords: tuple,
+    orchestration: str,
+    examples: str,
+    concepts: str,
+    max_chars_per_section: int,
+) -> str:
+    """
+    Build the requirement-specific documentation bundle
+    
+    The result only depends on the extracted keywords and the document
+    contents, so it is cached. Document texts are part of the key, which
+    keeps the cache consistent with edits picked up by _read_doc_file().
     
+    Args:
+        keywords: Keywords extracted from the requirement
+        orchestration: Task orchestration guide content
+        examples: Task tree examples content
+        concepts: Core concepts content
+        max_chars_per_section: Maximum characters per section
+        
+    Returns:
+        Relevant documentation content
+    """
+    keywords = list(keywords)
     sections = []
     
-    # Load and filter task orchestration docs
-    orchestration = load_task_orchestration_docs()
+    # Filter task orchestration docs
     if orchestration:
         if keywords:
             relevant_orchestration = _extract_relevant_sections(orchestration, keywords, max_chars_per_section)
@@ -231,8 +300,7 @@ def load_relevant_docs_for_requirement(requirement: str, max_chars_per_section:
             sections.append(relevant_orchestration)
             sections.append("")
     
-    # Load task examples (always include, they're valuable)
-    examples = load_task_examples()
+    # Task examples (always include, they're valuable)
     if examples:
         sections.append("=== Task Tree Examples ===")
         # Extract examples that match keywords
@@ -243,8 +311,7 @@ def load_relevant_docs_for_requirement(requirement: str, max_chars_per_section:
         sections.append(relevant_examples)
         sections.append("")
     
-    # Load core concepts (essential, but filtered)
-    concepts = load_concepts()
+    # Core concepts (essential, but filtered)
     if concepts:
         sections.append("=== Core Concepts (Summary) ===")
         concepts_truncated = _truncate_text(concepts, max_chars_per_section // 2)
@@ -261,13 +328,34 @@ def load_all_docs(max_chars_per_section: int = 2000) -> str:
     Args:
         max_chars_per_section: Maximum characters per documentation section
         
+    Returns:
+        Combined documentation content (truncated)
+    """
+    return _build_all_docs(
+        load_concepts(),
+        load_task_orchestration_docs(),
+        load_task_examples(),
+        max_chars_per_section,
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_all_docs(concepts: str, orchestration: str, examples: str, max_chars_per_section: int) -> str:
+    """
+    Build the combined documentation bundle (cached per document contents and size limit)
+    
+    Args:
+        concepts: Core concepts content
+        orchestration: Task orchestration guide content
+        examples: Task tree examples content
+        max_chars_per_section: Maximum characters per documentation section
+        
     Returns:
         Combined documentation content (truncated)
     """
     sections = []
     
     # Core concepts (essential, keep more)
-    concepts = load_concepts()
     if concepts:
         sections.append("=== Core Concepts (Summary) ===")
         # Extract key points from concepts
@@ -276,19 +364,20 @@ def load_all_docs(max_chars_per_section: int = 2000) -> str:
         sections.append("")
     
     # Task orchestration (key rules only)
-    orchestration = load_task_orchestration_docs()
     if orchestration:
         sections.append("=== Task Orchestration (Key Rules) ===")
         # Extract key rules about parent_id vs dependencies
         key_rules = []
+        key_rules_len = -1  # len('\n'.join(key_rules)), maintained incrementally
         lines = orchestration.split('\n')
         in_key_section = False
         for line in lines:
-            if 'parent_id' in line.lower() or 'dependencies' in line.lower() or 'execution order' in line.lower():
+            if not in_key_section and _KEY_RULES_RE.search(line):
                 in_key_section = True
             if in_key_section and line.strip():
                 key_rules.append(line)
-                if len('\n'.join(key_rules)) > max_chars_per_section:
+                key_rules_len += len(line) + 1
+                if key_rules_len > max_chars_per_section:
                     break
         
         if key_rules:
@@ -298,7 +387,6 @@ def load_all_docs(max_chars_per_section: int = 2000) -> str:
         sections.append("")
     
     # Task examples (just a few examples)
-    examples = load_task_examples()
     if examples:
         sections.append("=== Task Tree Examples (Key Examples) ===")
         # Extract first example
@@ -108,13 +108,13 @@ def format_executors_for_llm(max_executors: int = 20, max_schema_props: int = 5)
     Returns:
         Formatted string containing executor information (truncated)
     """
-    executors = get_available_executors()
+    all_executors = get_available_executors()
     
-    if not executors:
+    if not all_executors:
         return "No executors are currently registered."
     
     # Limit number of executors
-    executors = executors[:max_executors]
+    executors = all_executors[:max_executors]
     
     lines = ["Available Executors (showing most common):", ""]
     
@@ -142,8 +142,8 @@ def format_executors_for_llm(max_executors: int = 20, max_schema_props: int = 5)
         
         lines.append("")
     
-    if len(get_available_executors()) > max_executors:
-        lines.append(f"[Note: {len(get_available_executors()) - max_executors} more executors available]")
+    if len(all_executors) > max_executors:
+        lines.append(f"[Note: {len(all_executors) - max_executors} more executors available]")
     
     return "\n".join(lines)
 
@@ -9,9 +9,11 @@ TaskCreator.create_task_tree_from_array().
 import json
 import re
 import uuid
-from typing import Dict, Any, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
 from aipartnerupflow.core.base import BaseTask
 from aipartnerupflow.core.extensions.decorators import executor_register
+from aipartnerupflow.core.extensions.registry import get_registry
 from aipartnerupflow.core.utils.logger import get_logger
 from aipartnerupflow.extensions.generate.executor_info import format_executors_for_llm
 from aipartnerupflow.extensions.generate.docs_loader import load_relevant_docs_for_requirement
@@ -19,6 +21,353 @@ from aipartnerupflow.extensions.generate.llm_client import create_llm_client
 
 logger = get_logger(__name__)
 
+try:
+    # Optional faster JSON parser, used for LLM responses when installed
+    import orjson
+except ImportError:
+    orjson = None
+
+# UUID validation regex (UUID v4 format: 8-4-4-4-12)
+_UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$', re.IGNORECASE)
+
+# Example output embedded in the prompt, kept pre-formatted (json.dumps(..., indent=2) style)
+# so no serialization is needed. The first task has no parent_id (root task); each following
+# task's parent_id is the previous task, which is also its first dependency.
+_EXAMPLE_JSON = """[
+  {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "name": "Fetch API Data",
+    "user_id": "user123",
+    "schemas": {
+      "method": "rest_executor"
+    },
+    "inputs": {
+      "url": "https://api.example.com/data",
+      "method": "GET",
+      "headers": {
+        "Accept": "application/json"
+      }
+    },
+    "priority": 1
+  },
+  {
+    "id": "660e8400-e29b-41d4-a716-446655440001",
+    "name": "Process Data",
+    "user_id": "user123",
+    "schemas": {
+      "method": "command_executor"
+    },
+    "parent_id": "550e8400-e29b-41d4-a716-446655440000",
+    "dependencies": [
+      {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "required": true
+      }
+    ],
+    "inputs": {
+      "command": "python process_data.py --input /tmp/api_response.json --output /tmp/processed.json"
+    },
+    "priority": 2
+  },
+  {
+    "id": "770e8400-e29b-41d4-a716-446655440002",
+    "name": "Notify Completion",
+    "user_id": "user123",
+    "schemas": {
+      "method": "rest_executor"
+    },
+    "parent_id": "660e8400-e29b-41d4-a716-446655440001",
+    "dependencies": [
+      {
+        "id": "660e8400-e29b-41d4-a716-446655440001",
+        "required": true
+      }
+    ],
+    "inputs": {
+      "url": "https://api.example.com/notify",
+      "method": "POST",
+      "data": {
+        "status": "completed"
+      }
+    },
+    "priority": 2
+  }
+]"""
+
+# Static prompt text surrounding the per-request sections in _build_llm_prompt().
+# Joined once at import so building a prompt only concatenates a few strings.
+_PROMPT_PREFIX = "\n".join([
+    "You are an expert task tree generator for the aipartnerupflow framework.",
+    "Your goal is to understand the business requirement and generate a valid, practical task tree JSON array.",
+    "",
+    "=== Your Task ===",
+    "Analyze the requirement below and generate a task tree that:",
+    "1. Fulfills the business need described in the requirement",
+    "2. Uses appropriate executors from the available list",
+    "3. Sets correct dependencies to ensure proper execution order",
+    "4. Includes complete, realistic input parameters",
+    "5. Follows framework best practices and patterns",
+    "",
+    "=== Critical Framework Rules ===",
+    "⚠️ IMPORTANT: Understand these concepts correctly:",
+    "",
+    "1. parent_id vs dependencies:",
+    "   - parent_id: REQUIRED for tree structure - ensures all tasks form a single tree",
+    "   - dependencies: Controls EXECUTION ORDER - tasks wait for dependencies to complete",
+    "   - CRITICAL: If a task has dependencies, it MUST have a parent_id (usually the first dependency)",
+    "   - Example: Task B depends on Task A → Task B must have parent_id='task_a' AND dependencies=[{'id': 'task_a'}]",
+    "",
+    "2. Task identification:",
+    "   - ALL tasks MUST have 'id' field with UUID format (e.g., '550e8400-e29b-41d4-a716-446655440000')",
+    "   - Task IDs must be valid UUIDs (36 characters: 8-4-4-4-12 format)",
+    "   - All references (parent_id, dependencies) must use 'id'",
+    "   - Generate unique UUIDs for each task using UUID v4 format",
+    "",
+    "3. Tree structure (CRITICAL):",
+    "   - Exactly ONE root task (task with no parent_id and no dependencies)",
+    "   - All other tasks MUST have a parent_id to form a single tree",
+    "   - If a task depends on multiple tasks, set parent_id to the FIRST dependency",
+    "   - For sequential tasks (A → B → C), each task's parent_id should be the previous task",
+    "   - All tasks must be reachable from the root via parent_id chain",
+    "   - No circular dependencies",
+    "",
+    "4. Executor matching (CRITICAL):",
+    "   - Task 'schemas.method' field MUST exactly match an available executor ID from the extensions registry",
+    "   - The 'name' field is a descriptive task name (e.g., 'Get System Info', 'Process Data'), NOT the executor ID",
+    "   - Input parameters MUST match the executor's input schema",
+    "",
+    "=== Task Object Structure ===",
+    "{",
+    '  "name": "Get System Information",  // REQUIRED: Descriptive task name (human-readable, NOT executor ID)',
+    '  "id": "550e8400-e29b-41d4-a716-446655440000",  // REQUIRED: UUID v4 format (36 chars)',
+    '  "user_id": "user123",         // REQUIRED: User identifier (use the provided user_id)',
+    '  "priority": 1,                // OPTIONAL: 0=urgent, 1=high, 2=normal, 3=low (default: 1)',
+    '  "inputs": {                   // OPTIONAL: Executor-specific input parameters',
+    '    "resource": "cpu"           // Must match executor input schema',
+    '  },',
+    '  "schemas": {                  // REQUIRED: Task schemas (must include method field)',
+    '    "method": "system_info_executor"  // REQUIRED: Must exactly match executor ID from extensions registry',
+    '  },',
+    '  "parent_id": "task_0",        // OPTIONAL: For organization only (like folders)',
+    '  "dependencies": [             // OPTIONAL: Controls execution order',
+    '    {"id": "task_0", "required": true}  // Task waits for task_0 to complete',
+    '  ]',
+    "}",
+    "",
+    "=== Framework Documentation (Relevant to Your Requirement) ===",
+])
+
+_PROMPT_SUFFIX = "\n".join([
+    "",
+    "=== Analysis & Generation Instructions ===",
+    "1. UNDERSTAND the requirement:",
+    "   - What is the business goal?",
+    "   - What steps are needed to achieve it?",
+    "   - What data flows between steps?",
+    "",
+    "2. DESIGN the task tree:",
+    "   - Identify the root task (starting point - no parent_id, no dependencies)",
+    "   - Map business steps to executor tasks",
+    "   - Determine execution order (use dependencies)",
+    "   - Set parent_id for ALL non-root tasks to form a single tree:",
+    "     * For sequential tasks: each task's parent_id = previous task",
+    "     * For tasks with multiple dependencies: parent_id = first dependency",
+    "     * For parallel tasks: choose one as root, others as its children",
+    "",
+    "3. SELECT executors:",
+    "   - Match each step to an appropriate executor from the available executors list",
+    "   - Set schemas.method to the executor's ID (e.g., 'system_info_executor', 'command_executor', 'rest_executor')",
+    "   - Check executor input schemas to understand required parameters",
+    "   - Ensure all required parameters are provided in the inputs field",
+    "",
+    "4. CONFIGURE tasks:",
+    "   - Set a descriptive 'name' field for each task (e.g., 'Get System Info', 'Process Data', 'Send Notification')",
+    "   - Set 'schemas.method' to the executor ID (e.g., 'system_info_executor', 'command_executor', 'rest_executor')",
+    "   - Set complete, realistic input parameters matching the executor's input schema",
+    "   - For command_executor: use full commands with arguments (e.g., 'python script.py --input file.json')",
+    "   - For rest_executor: use complete URLs and proper HTTP methods",
+    "   - Set dependencies to ensure correct execution order",
+    "   - Set parent_id for ALL non-root tasks (REQUIRED for tree structure):",
+    "     * If task has dependencies, set parent_id to the FIRST dependency",
+    "     * For sequential chain: parent_id = previous task in chain",
+    "     * This ensures all tasks form a single tree with one root",
+    "",
+    "5. VALIDATE:",
+    "   - Single root task",
+    "   - All references valid",
+    "   - No circular dependencies",
+    "   - All schemas.method values match available executor IDs from extensions registry",
+    "   - All input parameters match executor schemas",
+    "   - Each task has a descriptive 'name' field (not executor ID) and correct 'schemas.method' field (executor ID)",
+    "",
+    "=== Output Format ===",
+    "Return ONLY a valid JSON array of task objects.",
+    "No markdown code blocks, no explanations, no comments.",
+    "The JSON should be directly parseable.",
+    "",
+    "Example output structure:",
+    _EXAMPLE_JSON,
+    "",
+    "=== CRITICAL: parent_id Rules ===",
+    "1. Root task: NO parent_id (only one root task allowed)",
+    "2. Sequential tasks: parent_id = previous task in the chain",
+    "3. Tasks with dependencies: parent_id = FIRST dependency",
+    "4. Parallel tasks: Choose one as root, others have parent_id = root",
+    "5. Example: If Task B depends on [Task A, Task C], then:",
+    "   - Task B.parent_id = '550e8400-e29b-41d4-a716-446655440000' (first dependency's UUID)",
+    "   - Task B.dependencies = [{'id': '550e8400-e29b-41d4-a716-446655440000'}, {'id': '660e8400-e29b-41d4-a716-446655440001'}]",
+    "",
+])
+
+_PROMPT_FOOTER = "\n".join([
+    "",
+    "=== Generate Task Tree ===",
+    "Now generate the task tree JSON array based on the requirement above.",
+])
+
+
+@lru_cache(maxsize=8)
+def _get_executors_section(executors: Tuple[Any, ...]) -> str:
+    """
+    Get the executor list for the prompt, already truncated
+    
+    Collecting executor info instantiates every registered executor, so the
+    result is cached per snapshot of the registered executor extensions.
+    Registering, replacing or removing an executor changes the snapshot and
+    rebuilds the section.
+    
+    Args:
+        executors: Registered executor extensions (used as the cache key)
+        
+    Returns:
+        Executor information, at most 3500 characters
+    """
+    return format_executors_for_llm(max_executors=15, max_schema_props=3)[:3500]
+
+
+def _loads_json(text: str) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed
+    
+    orjson is stricter than the standard library (e.g. it rejects NaN and
+    integers beyond 64 bits), so anything it rejects is re-parsed with json
+    to keep the accepted input unchanged.
+    
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _find_fence(text: str, start: int) -> int:
+    """
+    Find the next markdown code fence (```) at or after start
+    
+    Steps through single backticks with str.find, which is much faster than
+    searching for the three-character fence directly on long responses.
+    
+    Returns:
+        Index of the fence, or -1 if there is none
+    """
+    i = text.find("`", start)
+    while i != -1 and not text.startswith("```", i):
+        i = text.find("`", i + 1)
+    return i
+
+
+def _extract_json_array(text: str) -> str:
+    """
+    Extract the JSON array text from an LLM response
+    
+    Handles a bare array, an array inside a markdown code fence, and an array
+    surrounded by prose, using str.find/slicing instead of backtracking regexes.
+    
+    Args:
+        text: Stripped LLM response text
+        
+    Returns:
+        The JSON array substring, or the original text if no array is found
+    """
+    # Fast path: the response is a bare JSON array. Only taken when there is
+    # no backtick, since text like "[Intro] ```json [...]``` [End]" also starts
+    # and ends with brackets but holds the array inside a code fence.
+    if text.startswith("[") and text.endswith("]") and text.find("`") == -1:
+        return text
+    
+    # Prefer the first markdown code fence whose body is a JSON array
+    fence_start = _find_fence(text, 0)
+    while fence_start != -1:
+        body_start = fence_start + 3
+        # Fences may use more than three backticks
+        while text.startswith("`", body_start):
+            body_start += 1
+        if text.startswith("json", body_start):
+            body_start += 4
+        fence_end = _find_fence(text, body_start)
+        if fence_end == -1:
+            break
+        body = text[body_start:fence_end].strip()
+        if body.startswith("[") and body.endswith("]"):
+            return body
+        # A closing fence may also open the next block
+        fence_start = fence_end
+    
+    # Otherwise take everything between the outermost brackets
+    start = text.find("[")
+    end = text.rfind("]")
+    if start == -1 or end < start:
+        return text
+    return text[start:end + 1]
+
+
+def _find_balanced_array(text: str) -> Optional[str]:
+    """
+    Find the first bracket-balanced JSON array in text
+    
+    Single linear scan tracking bracket depth, skipping over string literals.
+    Used to recover when prose after the array contains brackets of its own.
+    
+    Args:
+        text: LLM response text
+        
+    Returns:
+        The array substring, or None if no balanced array is found
+    """
+    start = text.find("[")
+    if start == -1:
+        return None
+    
+    depth = 0
+    i = start
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char == '"':
+            # Jump to the closing quote, skipping escaped quotes
+            i = text.find('"', i + 1)
+            while i != -1:
+                backslashes = 0
+                while text[i - 1 - backslashes] == "\\":
+                    backslashes += 1
+                if backslashes % 2 == 0:
+                    break
+                i = text.find('"', i + 1)
+            if i == -1:
+                return None
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+        i += 1
+    return None
+
 
 @executor_register()
 class GenerateExecutor(BaseTask):
@@ -188,185 +537,26 @@ class GenerateExecutor(BaseTask):
         docs = load_relevant_docs_for_requirement(requirement, max_chars_per_section=2000)
         
         # Get executor information (limited but relevant)
-        executors_info = format_executors_for_llm(max_executors=15, max_schema_props=3)
-        
-        # Build intelligent, requirement-focused prompt
-        prompt_parts = [
-            "You are an expert task tree generator for the aipartnerupflow framework.",
-            "Your goal is to understand the business requirement and generate a valid, practical task tree JSON array.",
-            "",
-            "=== Your Task ===",
-            "Analyze the requirement below and generate a task tree that:",
-            "1. Fulfills the business need described in the requirement",
-            "2. Uses appropriate executors from the available list",
-            "3. Sets correct dependencies to ensure proper execution order",
-            "4. Includes complete, realistic input parameters",
-            "5. Follows framework best practices and patterns",
-            "",
-            "=== Critical Framework Rules ===",
-            "⚠️ IMPORTANT: Understand these concepts correctly:",
-            "",
-            "1. parent_id vs dependencies:",
-            "   - parent_id: REQUIRED for tree structure - ensures all tasks form a single tree",
-            "   - dependencies: Controls EXECUTION ORDER - tasks wait for dependencies to complete",
-            "   - CRITICAL: If a task has dependencies, it MUST have a parent_id (usually the first dependency)",
-            "   - Example: Task B depends on Task A → Task B must have parent_id='task_a' AND dependencies=[{'id': 'task_a'}]",
-            "",
-            "2. Task identification:",
-            "   - ALL tasks MUST have 'id' field with UUID format (e.g., '550e8400-e29b-41d4-a716-446655440000')",
-            "   - Task IDs must be valid UUIDs (36 characters: 8-4-4-4-12 format)",
-            "   - All references (parent_id, dependencies) must use 'id'",
-            "   - Generate unique UUIDs for each task using UUID v4 format",
-            "",
-            "3. Tree structure (CRITICAL):",
-            "   - Exactly ONE root task (task with no parent_id and no dependencies)",
-            "   - All other tasks MUST have a parent_id to form a single tree",
-            "   - If a task depends on multiple tasks, set parent_id to the FIRST dependency",
-            "   - For sequential tasks (A → B → C), each task's parent_id should be the previous task",
-            "   - All tasks must be reachable from the root via parent_id chain",
-            "   - No circular dependencies",
-            "",
-            "4. Executor matching (CRITICAL):",
-            "   - Task 'schemas.method' field MUST exactly match an available executor ID from the extensions registry",
-            "   - The 'name' field is a descriptive task name (e.g., 'Get System Info', 'Process Data'), NOT the executor ID",
-            "   - Input parameters MUST match the executor's input schema",
-            "",
-            "=== Task Object Structure ===",
-            "{",
-            '  "name": "Get System Information",  // REQUIRED: Descriptive task name (human-readable, NOT executor ID)',
-            '  "id": "550e8400-e29b-41d4-a716-446655440000",  // REQUIRED: UUID v4 format (36 chars)',
-            '  "user_id": "user123",         // REQUIRED: User identifier (use the provided user_id)',
-            '  "priority": 1,                // OPTIONAL: 0=urgent, 1=high, 2=normal, 3=low (default: 1)',
-            '  "inputs": {                   // OPTIONAL: Executor-specific input parameters',
-            '    "resource": "cpu"           // Must match executor input schema',
-            '  },',
-            '  "schemas": {                  // REQUIRED: Task schemas (must include method field)',
-            '    "method": "system_info_executor"  // REQUIRED: Must exactly match executor ID from extensions registry',
-            '  },',
-            '  "parent_id": "task_0",        // OPTIONAL: For organization only (like folders)',
-            '  "dependencies": [             // OPTIONAL: Controls execution order',
-            '    {"id": "task_0", "required": true}  // Task waits for task_0 to complete',
-            '  ]',
-            "}",
-            "",
-            "=== Framework Documentation (Relevant to Your Requirement) ===",
-            docs[:2500] if len(docs) > 2500 else docs,
-            "",
-            "=== Available Executors ===",
-            executors_info[:3500] if len(executors_info) > 3500 else executors_info,
-            "",
-            "=== Business Requirement ===",
-            requirement,
-            "",
-            "=== Analysis & Generation Instructions ===",
-            "1. UNDERSTAND the requirement:",
-            "   - What is the business goal?",
-            "   - What steps are needed to achieve it?",
-            "   - What data flows between steps?",
-            "",
-            "2. DESIGN the task tree:",
-            "   - Identify the root task (starting point - no parent_id, no dependencies)",
-            "   - Map business steps to executor tasks",
-            "   - Determine execution order (use dependencies)",
-            "   - Set parent_id for ALL non-root tasks to form a single tree:",
-            "     * For sequential tasks: each task's parent_id = previous task",
-            "     * For tasks with multiple dependencies: parent_id = first dependency",
-            "     * For parallel tasks: choose one as root, others as its children",
-            "",
-            "3. SELECT executors:",
-            "   - Match each step to an appropriate executor from the available executors list",
-            "   - Set schemas.method to the executor's ID (e.g., 'system_info_executor', 'command_executor', 'rest_executor')",
-            "   - Check executor input schemas to understand required parameters",
-            "   - Ensure all required parameters are provided in the inputs field",
-            "",
-            "4. CONFIGURE tasks:",
-            "   - Set a descriptive 'name' field for each task (e.g., 'Get System Info', 'Process Data', 'Send Notification')",
-            "   - Set 'schemas.method' to the executor ID (e.g., 'system_info_executor', 'command_executor', 'rest_executor')",
-            "   - Set complete, realistic input parameters matching the executor's input schema",
-            "   - For command_executor: use full commands with arguments (e.g., 'python script.py --input file.json')",
-            "   - For rest_executor: use complete URLs and proper HTTP methods",
-            "   - Set dependencies to ensure correct execution order",
-            "   - Set parent_id for ALL non-root tasks (REQUIRED for tree structure):",
-            "     * If task has dependencies, set parent_id to the FIRST dependency",
-            "     * For sequential chain: parent_id = previous task in chain",
-            "     * This ensures all tasks form a single tree with one root",
-            "",
-            "5. VALIDATE:",
-            "   - Single root task",
-            "   - All references valid",
-            "   - No circular dependencies",
-            "   - All schemas.method values match available executor IDs from extensions registry",
-            "   - All input parameters match executor schemas",
-            "   - Each task has a descriptive 'name' field (not executor ID) and correct 'schemas.method' field (executor ID)",
-            "",
-            "=== Output Format ===",
-            "Return ONLY a valid JSON array of task objects.",
-            "No markdown code blocks, no explanations, no comments.",
-            "The JSON should be directly parseable.",
-            "",
-            "Example output structure:",
-            json.dumps([
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "name": "Fetch API Data",
-                    "user_id": "user123",
-                    "schemas": {"method": "rest_executor"},
-                    "inputs": {
-                        "url": "https://api.example.com/data",
-                        "method": "GET",
-                        "headers": {"Accept": "application/json"}
-                    },
-                    "priority": 1
-                    # No parent_id = root task
-                },
-                {
-                    "id": "660e8400-e29b-41d4-a716-446655440001",
-                    "name": "Process Data",
-                    "user_id": "user123",
-                    "schemas": {"method": "command_executor"},
-                    "parent_id": "550e8400-e29b-41d4-a716-446655440000",  # REQUIRED: parent_id = first dependency
-                    "dependencies": [{"id": "550e8400-e29b-41d4-a716-446655440000", "required": True}],
-                    "inputs": {
-                        "command": "python process_data.py --input /tmp/api_response.json --output /tmp/processed.json"
-                    },
-                    "priority": 2
-                },
-                {
-                    "id": "770e8400-e29b-41d4-a716-446655440002",
-                    "name": "Notify Completion",
-                    "user_id": "user123",
-                    "schemas": {"method": "rest_executor"},
-                    "parent_id": "660e8400-e29b-41d4-a716-446655440001",  # REQUIRED: parent_id = previous task in chain
-                    "dependencies": [{"id": "660e8400-e29b-41d4-a716-446655440001", "required": True}],
-                    "inputs": {
-                        "url": "https://api.example.com/notify",
-                        "method": "POST",
-                        "data": {"status": "completed"}
-                    },
-                    "priority": 2
-                }
-            ], indent=2),
-            "",
-            "=== CRITICAL: parent_id Rules ===",
-            "1. Root task: NO parent_id (only one root task allowed)",
-            "2. Sequential tasks: parent_id = previous task in the chain",
-            "3. Tasks with dependencies: parent_id = FIRST dependency",
-            "4. Parallel tasks: Choose one as root, others have parent_id = root",
-            "5. Example: If Task B depends on [Task A, Task C], then:",
-            "   - Task B.parent_id = '550e8400-e29b-41d4-a716-446655440000' (first dependency's UUID)",
-            "   - Task B.dependencies = [{'id': '550e8400-e29b-41d4-a716-446655440000'}, {'id': '660e8400-e29b-41d4-a716-446655440001'}]",
-            "",
-        ]
-        
-        if user_id:
-            prompt_parts.append("")
-            prompt_parts.append(f"Note: Use user_id='{user_id}' for all generated tasks.")
-        
-        prompt_parts.append("")
-        prompt_parts.append("=== Generate Task Tree ===")
-        prompt_parts.append("Now generate the task tree JSON array based on the requirement above.")
-        
-        return "\n".join(prompt_parts)
+        executors_info = _get_executors_section(tuple(get_registry().list_executors()))
+        
+        user_note = f"\n\nNote: Use user_id='{user_id}' for all generated tasks." if user_id else ""
+        
+        # Build requirement-focused prompt: only the documentation, executor list
+        # and requirement vary per request, the rest is pre-joined at import.
+        # A single f-string sizes the result once instead of joining a list.
+        # (str.format is not used because the static text contains JSON braces.)
+        return (
+            f"{_PROMPT_PREFIX}\n"
+            f"{docs[:2500]}\n"  # Slicing returns docs itself when it is already short enough
+            "\n"
+            "=== Available Executors ===\n"
+            f"{executors_info}\n"
+            "\n"
+            "=== Business Requirement ===\n"
+            f"{requirement}\n"
+            f"{_PROMPT_SUFFIX}{user_note}\n"
+            f"{_PROMPT_FOOTER}"
+        )
     
     def _parse_llm_response(self, response: str) -> List[Dict[str, Any]]:
         """
@@ -381,24 +571,24 @@ class GenerateExecutor(BaseTask):
         Raises:
             ValueError: If response cannot be parsed
         """
-        # Try to extract JSON from response (might be wrapped in markdown code blocks)
+        # Extract JSON from response (might be wrapped in markdown code blocks or prose)
         response = response.strip()
-        
-        # Remove markdown code blocks if present
-        json_match = re.search(r'```(?:json)?\s*(\[.*?\])\s*```', response, re.DOTALL)
-        if json_match:
-            response = json_match.group(1)
-        else:
-            # Try to find JSON array directly
-            json_match = re.search(r'(\[.*\])', response, re.DOTALL)
-            if json_match:
-                response = json_match.group(1)
+        json_text = _extract_json_array(response)
         
         # Parse JSON
         try:
-            tasks = json.loads(response)
+            tasks = _loads_json(json_text)
         except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON from LLM response: {e}. Response: {response[:500]}")
+            error = f"Failed to parse JSON from LLM response: {e}. Response: {json_text[:500]}"
+            # Brackets in prose after the array end up in the outermost-bracket
+            # slice, so retry with the first balanced array before giving up
+            balanced = _find_balanced_array(response)
+            if balanced is None or balanced == json_text:
+                raise ValueError(error)
+            try:
+                tasks = _loads_json(balanced)
+            except json.JSONDecodeError:
+                raise ValueError(error)
         
         # Validate it's a list
         if not isinstance(tasks, list):
@@ -434,9 +624,6 @@ class GenerateExecutor(BaseTask):
             else:
                 logger.debug("No user_id available from BaseTask.task.user_id (task.user_id is None)")
         
-        # UUID validation regex (UUID v4 format: 8-4-4-4-12)
-        uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$', re.IGNORECASE)
-        
         # Step 1: Build task ID mapping (name -> task) for reference lookup
         name_to_task: Dict[str, Dict[str, Any]] = {}
         id_to_task: Dict[str, Dict[str, Any]] = {}
@@ -484,7 +671,7 @@ class GenerateExecutor(BaseTask):
             old_id = task.get("id")
             if old_id:
                 # Check if it's a valid UUID
-                if not uuid_pattern.match(old_id):
+                if not _UUID_PATTERN.match(old_id):
                     # Generate new UUID and track mapping
                     new_id = str(uuid.uuid4())
                     id_mapping[old_id] = new_id
@@ -506,7 +693,7 @@ class GenerateExecutor(BaseTask):
                 if parent_ref in id_mapping:
                     task["parent_id"] = id_mapping[parent_ref]
                 # If parent_ref is not a UUID, try to find the task by name and use its ID
-                elif not uuid_pattern.match(parent_ref):
+                elif not _UUID_PATTERN.match(parent_ref):
                     if parent_ref in name_to_task:
                         task["parent_id"] = name_to_task[parent_ref]["id"]
                         logger.debug(f"Updated parent_id for task '{task.get('name')}': {parent_ref} -> {name_to_task[parent_ref]['id']}")
@@ -517,7 +704,7 @@ class GenerateExecutor(BaseTask):
                             task["parent_id"] = mapped_id
                 
                 # Final validation: ensure parent_id is a valid UUID
-                if task["parent_id"] and not uuid_pattern.match(task["parent_id"]):
+                if task["parent_id"] and not _UUID_PATTERN.match(task["parent_id"]):
                     logger.warning(f"Task '{task.get('name')}' has invalid parent_id '{task['parent_id']}', removing it")
                     task.pop("parent_id", None)
             
@@ -533,7 +720,7 @@ class GenerateExecutor(BaseTask):
                                 dep["id"] = id_mapping[dep_id]
                                 updated_deps.append(dep)
                             # If dep_id is not a UUID, try to find the task by name and use its ID
-                            elif not uuid_pattern.match(dep_id):
+                            elif not _UUID_PATTERN.match(dep_id):
                                 if dep_id in name_to_task:
                                     dep["id"] = name_to_task[dep_id]["id"]
                                     updated_deps.append(dep)
@@ -577,73 +764,76 @@ class GenerateExecutor(BaseTask):
         if not tasks:
             return {"valid": False, "error": "Tasks array is empty"}
         
-        # Check all tasks have 'name' field
+        # Pass 1: check all tasks have 'name' field and collect names/ids
+        names: List[Any] = []
+        ids: List[Any] = []
         for i, task in enumerate(tasks):
             if "name" not in task:
                 return {"valid": False, "error": f"Task at index {i} is missing 'name' field"}
-            if not task["name"]:
+            name = task["name"]
+            if not name:
                 return {"valid": False, "error": f"Task at index {i} has empty 'name' field"}
+            names.append(name)
+            if "id" in task:
+                ids.append(task["id"])
         
         # Check id consistency (either all have id or none do)
-        tasks_with_id = sum(1 for task in tasks if "id" in task)
-        tasks_without_id = len(tasks) - tasks_with_id
-        
-        if tasks_with_id > 0 and tasks_without_id > 0:
+        tasks_with_id = len(ids)
+        if tasks_with_id > 0 and tasks_with_id < len(tasks):
             return {
                 "valid": False,
                 "error": "Mixed mode not supported: either all tasks must have 'id', or all tasks must not have 'id'"
             }
         
-        # Build identifier sets
-        if tasks_with_id > 0:
-            # Use id for references
-            identifiers: Set[str] = {task["id"] for task in tasks if "id" in task}
-            identifier_to_task = {task["id"]: task for task in tasks if "id" in task}
-        else:
-            # Use name for references
-            identifiers = {task["name"] for task in tasks}
-            identifier_to_task = {task["name"]: task for task in tasks}
+        # Build identifier sets (use id for references if present, otherwise name)
+        references = ids if tasks_with_id > 0 else names
+        identifiers: Set[str] = set(references)
         
         # Check for duplicate identifiers
         if len(identifiers) < len(tasks):
             return {"valid": False, "error": "Duplicate task identifiers found"}
         
-        # Validate parent_id references
-        for i, task in enumerate(tasks):
+        # Pass 2: validate parent_id and dependency references, collect root tasks
+        # and build the parent -> children adjacency used for the reachability check.
+        # parent_id errors are reported before dependency errors, so the first
+        # dependency error is held until every parent_id has been checked.
+        dependency_error: Optional[str] = None
+        root_tasks: List[Dict[str, Any]] = []
+        children: Dict[Any, List[Any]] = {}
+        for name, reference, task in zip(names, references, tasks):
             parent_id = task.get("parent_id")
             if parent_id:
                 if parent_id not in identifiers:
                     return {
                         "valid": False,
-                        "error": f"Task '{task.get('name', i)}' has parent_id '{parent_id}' which is not in the tasks array"
+                        "error": f"Task '{name}' has parent_id '{parent_id}' which is not in the tasks array"
                     }
-        
-        # Validate dependency references
-        for i, task in enumerate(tasks):
+                children.setdefault(parent_id, []).append(reference)
+            else:
+                root_tasks.append(task)
+            
+            if dependency_error is not None:
+                continue
             dependencies = task.get("dependencies")
             if dependencies:
                 if not isinstance(dependencies, list):
-                    return {
-                        "valid": False,
-                        "error": f"Task '{task.get('name', i)}' has invalid dependencies (must be a list)"
-                    }
+                    dependency_error = f"Task '{name}' has invalid dependencies (must be a list)"
+                    continue
                 for dep in dependencies:
                     if isinstance(dep, dict):
                         dep_ref = dep.get("id") or dep.get("name")
                         if dep_ref and dep_ref not in identifiers:
-                            return {
-                                "valid": False,
-                                "error": f"Task '{task.get('name', i)}' has dependency '{dep_ref}' which is not in the tasks array"
-                            }
+                            dependency_error = f"Task '{name}' has dependency '{dep_ref}' which is not in the tasks array"
+                            break
                     elif isinstance(dep, str):
                         if dep not in identifiers:
-                            return {
-                                "valid": False,
-                                "error": f"Task '{task.get('name', i)}' has dependency '{dep}' which is not in the tasks array"
-                            }
+                            dependency_error = f"Task '{name}' has dependency '{dep}' which is not in the tasks array"
+                            break
+        
+        if dependency_error is not None:
+            return {"valid": False, "error": dependency_error}
         
         # Check for single root task
-        root_tasks = [task for task in tasks if not task.get("parent_id")]
         if len(root_tasks) == 0:
             return {"valid": False, "error": "No root task found (task with no parent_id)"}
         if len(root_tasks) > 1:
@@ -664,23 +854,19 @@ class GenerateExecutor(BaseTask):
         if tasks_with_id > 0:
             root_id = root_tasks[0]["id"]
             reachable = {root_id}
+            stack = [root_id]
+            while stack:
+                for child_id in children.get(stack.pop(), ()):
+                    if child_id not in reachable:
+                        reachable.add(child_id)
+                        stack.append(child_id)
             
-            def collect_reachable(current_id: str):
-                for task in tasks:
-                    if task.get("parent_id") == current_id:
-                        task_id = task["id"]
-                        if task_id not in reachable:
-                            reachable.add(task_id)
-                            collect_reachable(task_id)
-            
-            collect_reachable(root_id)
-            
-            all_ids = {task["id"] for task in tasks}
-            unreachable = all_ids - reachable
-            if unreachable:
+            if len(reachable) < len(identifiers):
+                # Names are only looked up on this error path, in task order
+                unreachable = [name for name, task_id in zip(names, ids) if task_id not in reachable]
                 return {
                     "valid": False,
-                    "error": f"Tasks not reachable from root: {[identifier_to_task[id].get('name', id) for id in unreachable]}"
+                    "error": f"Tasks not reachable from root: {unreachable}"
                 }
         
         return {"valid": True, "error": None}
@@ -331,6 +331,15 @@ class TestPackageDetection:
         """Test that missing packages return False"""
         # This package definitely doesn't exist
         assert _is_package_installed("nonexistent_package_xyz_123") is False
+    
+    def test_is_package_installed_caches_result(self):
+        """Test that repeated checks do not rescan installed distributions"""
+        _is_package_installed.cache_clear()
+        assert _is_package_installed("nonexistent_package_xyz_456") is False
+        
+        with patch("importlib.metadata.distributions") as mock_distributions:
+            assert _is_package_installed("nonexistent_package_xyz_456") is False
+            mock_distributions.assert_not_called()
 
 
 class TestEnvironmentVariableParsing:
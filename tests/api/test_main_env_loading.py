@@ -8,6 +8,7 @@ Tests the critical functionality for library usage:
 """
 import os
 import sys
+import warnings
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -20,6 +21,8 @@ api_main_module = importlib.import_module("aipartnerupflow.api.main")
 _load_env_file = api_main_module._load_env_file
 _setup_development_environment = api_main_module._setup_development_environment
 create_runnable_app = api_main_module.create_runnable_app
+main = api_main_module.main
+_get_startup_env = api_main_module._get_startup_env
 
 
 class TestLoadEnvFile:
@@ -80,38 +83,39 @@ class TestLoadEnvFile:
     
     def test_load_env_file_skips_when_dotenv_not_installed(self, tmp_path, monkeypatch):
         """Test that _load_env_file() gracefully handles missing python-dotenv"""
-        # This test verifies that the function handles ImportError gracefully
-        # Since dotenv is actually installed in the test environment, we test
-        # the error handling path by ensuring the function has proper try-except
-        # We can't easily mock the import inside the function, so we verify
-        # the code structure handles it correctly
+        cwd_env = tmp_path / ".env"
+        cwd_env.write_text("TEST_VAR=test_value\n")
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("TEST_VAR", raising=False)
         
-        # The actual implementation has:
-        # try:
-        #     from dotenv import load_dotenv
-        # except ImportError:
-        #     return
-        # 
-        # So we verify the function exists and can be called without error
-        # even if dotenv import would fail (which we can't easily test without
-        # actually uninstalling dotenv)
+        # Simulate python-dotenv not being installed
+        monkeypatch.setattr(api_main_module, "find_spec", lambda name: None)
         
-        # For now, we verify the function structure is correct by checking
-        # it doesn't crash when called normally
+        # Function should return early without error
+        _load_env_file()
+        
+        assert os.getenv("TEST_VAR") is None
+    
+    def test_load_env_file_skips_when_dotenv_is_not_python_dotenv(self, tmp_path, monkeypatch):
+        """Test that an importable "dotenv" without load_dotenv doesn't break startup"""
         cwd_env = tmp_path / ".env"
         cwd_env.write_text("TEST_VAR=test_value\n")
         
         monkeypatch.chdir(tmp_path)
         monkeypatch.delenv("TEST_VAR", raising=False)
         
-        # Function should complete without error
-        # (In a real scenario where dotenv is missing, it would return early)
+        # Shadow python-dotenv with an unrelated, empty module
+        fake_dotenv = tmp_path / "fake_modules"
+        fake_dotenv.mkdir()
+        (fake_dotenv / "dotenv.py").write_text("")
+        monkeypatch.syspath_prepend(str(fake_dotenv))
+        monkeypatch.delitem(sys.modules, "dotenv", raising=False)
+        
+        # Function should return early without error
         _load_env_file()
         
-        # If dotenv is available, TEST_VAR should be set
-        # If not available, it would be None (but we can't test that easily)
-        # This test at least verifies the function doesn't crash
-        assert True  # Function completed without error
+        assert os.getenv("TEST_VAR") is None
     
     def test_load_env_file_respects_existing_env_vars(self, tmp_path, monkeypatch):
         """Test that _load_env_file() doesn't override existing environment variables"""
@@ -140,6 +144,28 @@ class TestLoadEnvFile:
             assert True
 
 
+class TestGetStartupEnv:
+    """Test _get_startup_env() function"""
+    
+    def test_get_startup_env_snapshots_until_refresh(self, monkeypatch):
+        """Test that startup env values are cached until refreshed"""
+        monkeypatch.setenv("AIPARTNERUPFLOW_API_PORT", "9001")
+        env = _get_startup_env(refresh=True)
+        assert env["AIPARTNERUPFLOW_API_PORT"] == "9001"
+        
+        # Later changes are not visible until refresh
+        monkeypatch.setenv("AIPARTNERUPFLOW_API_PORT", "9002")
+        assert _get_startup_env()["AIPARTNERUPFLOW_API_PORT"] == "9001"
+        assert _get_startup_env(refresh=True)["AIPARTNERUPFLOW_API_PORT"] == "9002"
+    
+    def test_get_startup_env_missing_keys_are_none(self, monkeypatch):
+        """Test that unset keys are present with None values"""
+        monkeypatch.delenv("API_HOST", raising=False)
+        env = _get_startup_env(refresh=True)
+        assert "API_HOST" in env
+        assert env["API_HOST"] is None
+
+
 class TestSetupDevelopmentEnvironment:
     """Test _setup_development_environment() function"""
     
@@ -172,11 +198,28 @@ class TestSetupDevelopmentEnvironment:
             # Mock sys.path
             original_sys_path = sys.path.copy()
             try:
-                with patch("warnings.filterwarnings") as mock_warnings:
+                with warnings.catch_warnings():
+                    warnings.resetwarnings()
                     _setup_development_environment()
                     
                     # Should set up warnings filters
-                    assert mock_warnings.called
+                    ignored = {
+                        (f[2], f[3].pattern) for f in warnings.filters
+                        if f[0] == "ignore" and f[3] is not None
+                    }
+                    assert (SyntaxWarning, "pysbd") in ignored
+                    assert (DeprecationWarning, "websockets") in ignored
+                    assert (DeprecationWarning, "uvicorn") in ignored
+                    
+                    # A second call does not re-install existing filters
+                    filter_count = len(warnings.filters)
+                    with patch("warnings.filterwarnings") as mock_warnings:
+                        _setup_development_environment()
+                        assert not mock_warnings.called
+                    assert len(warnings.filters) == filter_count
+                    
+                    # sys.path is only modified when executed as __main__
+                    assert sys.path == original_sys_path
             finally:
                 # Restore sys.path
                 sys.path[:] = original_sys_path
@@ -303,3 +346,92 @@ class TestCreateRunnableApp:
                             assert call_kwargs["custom_middleware"] == custom_middleware
                             assert app is not None
 
+    @pytest.mark.asyncio
+    async def test_create_runnable_app_records_startup_phases(self, monkeypatch):
+        """Test that create_runnable_app() records the duration of each startup phase"""
+        with patch("aipartnerupflow.api.main.create_app_by_protocol") as mock_create:
+            mock_create.return_value = MagicMock()
+            
+            with patch("aipartnerupflow.api.main.initialize_extensions") as mock_init:
+                with patch("aipartnerupflow.api.main._load_custom_task_model") as mock_load_model:
+                    with patch("aipartnerupflow.api.main._load_env_file"):
+                        with patch("aipartnerupflow.api.main._setup_development_environment"):
+                            create_runnable_app(protocol="a2a")
+                            
+                            # Custom TaskModel is loaded once, not again by extensions
+                            mock_init.assert_called_once_with(load_custom_task_model=False)
+                            mock_load_model.assert_called_once()
+                            
+                            phases = dict(api_main_module._startup_phases)
+                            for name in ("env", "extensions", "task_model", "database", "create_app"):
+                                assert name in phases
+                                assert phases[name] >= 0
+
+
+class TestMain:
+    """Test main() server configuration"""
+    
+    def _run_main(self, **kwargs):
+        """Run main() with app creation and uvicorn mocked, return uvicorn.run kwargs"""
+        with patch("aipartnerupflow.api.main.create_runnable_app") as mock_create:
+            mock_create.return_value = MagicMock()
+            with patch("uvicorn.run") as mock_run:
+                main(**kwargs)
+                return mock_run.call_args[1]
+    
+    def test_main_access_log_disabled_by_default(self, monkeypatch):
+        """Test that access logging is off unless requested"""
+        monkeypatch.delenv("AIPARTNERUPFLOW_ACCESS_LOG", raising=False)
+        api_main_module._get_startup_env(refresh=True)
+        
+        assert self._run_main()["access_log"] is False
+    
+    def test_main_access_log_enabled_from_env(self, monkeypatch):
+        """Test that AIPARTNERUPFLOW_ACCESS_LOG enables access logging"""
+        monkeypatch.setenv("AIPARTNERUPFLOW_ACCESS_LOG", "true")
+        api_main_module._get_startup_env(refresh=True)
+        
+        assert self._run_main()["access_log"] is True
+        assert self._run_main(access_log=False)["access_log"] is False
+    
+    def test_main_concurrency_defaults(self, monkeypatch):
+        """Test that workers are not recycled and concurrency scales with CPU count"""
+        monkeypatch.delenv("AIPARTNERUPFLOW_MAX_CONCURRENCY", raising=False)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        api_main_module._get_startup_env(refresh=True)
+        
+        run_kwargs = self._run_main()
+        assert run_kwargs["limit_max_requests"] is None
+        assert run_kwargs["limit_concurrency"] == 512
+    
+    def test_main_concurrency_from_env(self, monkeypatch):
+        """Test that AIPARTNERUPFLOW_MAX_CONCURRENCY overrides the default limit"""
+        monkeypatch.setenv("AIPARTNERUPFLOW_MAX_CONCURRENCY", "50")
+        api_main_module._get_startup_env(refresh=True)
+        
+        assert self._run_main()["limit_concurrency"] == 50
+        assert self._run_main(limit_concurrency=10)["limit_concurrency"] == 10
+    
+    def test_main_concurrency_invalid_env(self, monkeypatch):
+        """Test that a non-numeric AIPARTNERUPFLOW_MAX_CONCURRENCY names the variable in the error"""
+        monkeypatch.setenv("AIPARTNERUPFLOW_MAX_CONCURRENCY", "lots")
+        api_main_module._get_startup_env(refresh=True)
+        
+        with pytest.raises(ValueError, match="AIPARTNERUPFLOW_MAX_CONCURRENCY"):
+            self._run_main()
+    
+    @pytest.mark.parametrize("value", ["0", "-5"])
+    def test_main_concurrency_non_positive_env(self, monkeypatch, value):
+        """Test that a zero or negative AIPARTNERUPFLOW_MAX_CONCURRENCY is rejected"""
+        monkeypatch.setenv("AIPARTNERUPFLOW_MAX_CONCURRENCY", value)
+        api_main_module._get_startup_env(refresh=True)
+        
+        with pytest.raises(ValueError, match="AIPARTNERUPFLOW_MAX_CONCURRENCY"):
+            self._run_main()
+    
+    def test_main_concurrency_explicit_none_disables_limit(self, monkeypatch):
+        """Test that limit_concurrency=None reaches uvicorn as "no limit" """
+        monkeypatch.setenv("AIPARTNERUPFLOW_MAX_CONCURRENCY", "50")
+        api_main_module._get_startup_env(refresh=True)
+        
+        assert self._run_main(limit_concurrency=None)["limit_concurrency"] is None
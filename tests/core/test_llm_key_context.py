@@ -0,0 +1,50 @@
+"""
+Test LLM key context isolation
+"""
+
+import asyncio
+import pytest
+from aipartnerupflow.core.utils.llm_key_context import (
+    clear_llm_key_context,
+    get_llm_key_from_cli_params,
+    get_llm_key_from_header,
+    get_llm_provider_from_header,
+    set_llm_key_from_cli_params,
+    set_llm_key_from_header,
+)
+
+
+class TestLLMKeyContext:
+    """Test LLM key context storage"""
+
+    def test_set_and_clear(self):
+        """Test keys can be set and cleared"""
+        clear_llm_key_context()
+        set_llm_key_from_header("header-key", provider="openai")
+        set_llm_key_from_cli_params("cli-key")
+
+        assert get_llm_key_from_header() == "header-key"
+        assert get_llm_provider_from_header() == "openai"
+        assert get_llm_key_from_cli_params() == "cli-key"
+
+        clear_llm_key_context()
+        assert get_llm_key_from_header() is None
+        assert get_llm_provider_from_header() is None
+        assert get_llm_key_from_cli_params() is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_isolated(self):
+        """Test concurrent tasks on the same event loop don't see each other's keys"""
+        clear_llm_key_context()
+
+        async def handle_request(api_key: str) -> str:
+            clear_llm_key_context()
+            set_llm_key_from_header(api_key)
+            # Yield so the other request runs and sets its own key
+            await asyncio.sleep(0)
+            return get_llm_key_from_header()
+
+        results = await asyncio.gather(handle_request("key-a"), handle_request("key-b"))
+
+        assert results == ["key-a", "key-b"]
+        assert get_llm_key_from_header() is None
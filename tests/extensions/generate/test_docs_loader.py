@@ -2,6 +2,9 @@
 Test docs_loader module
 """
 
+import os
+
+from aipartnerupflow.extensions.generate import docs_loader
 from aipartnerupflow.extensions.generate.docs_loader import (
     load_task_orchestration_docs,
     load_task_examples,
@@ -42,4 +45,54 @@ class TestDocsLoader:
         assert isinstance(docs, str)
         # Should contain multiple sections
         assert len(docs) > 0
-
+    
+    def test_read_doc_file_cached_until_modified(self, tmp_path, monkeypatch):
+        """Test that doc files are served from cache until their mtime changes"""
+        monkeypatch.setattr(docs_loader, "_DOCS_DIR", tmp_path)
+        doc = tmp_path / "doc.md"
+        doc.write_text("first", encoding="utf-8")
+        
+        assert docs_loader._read_doc_file("doc.md") == "first"
+        info_before = docs_loader._read_doc_file_cached.cache_info()
+        assert docs_loader._read_doc_file("doc.md") == "first"
+        assert docs_loader._read_doc_file_cached.cache_info().hits == info_before.hits + 1
+        
+        # Modifying the file (new mtime) invalidates the cached content
+        doc.write_text("second", encoding="utf-8")
+        stat_result = doc.stat()
+        os.utime(doc, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+        assert docs_loader._read_doc_file("doc.md") == "second"
+    
+    def test_read_doc_file_missing_returns_empty(self, tmp_path, monkeypatch):
+        """Test that missing files and directories return empty string"""
+        monkeypatch.setattr(docs_loader, "_DOCS_DIR", tmp_path)
+        (tmp_path / "subdir").mkdir()
+        
+        assert docs_loader._read_doc_file("missing.md") == ""
+        assert docs_loader._read_doc_file("subdir") == ""
+    
+    def test_read_doc_file_normalizes_newlines(self, tmp_path, monkeypatch):
+        """Test that CRLF line endings are read as plain newlines"""
+        monkeypatch.setattr(docs_loader, "_DOCS_DIR", tmp_path)
+        (tmp_path / "crlf.md").write_bytes(b"line 1\r\nline 2\r\n")
+        
+        assert docs_loader._read_doc_file("crlf.md") == "line 1\nline 2\n"
+    
+    def test_docs_bundles_cached_per_contents(self, tmp_path, monkeypatch):
+        """Test that built doc bundles are reused until a source doc changes"""
+        monkeypatch.setattr(docs_loader, "_DOCS_DIR", tmp_path)
+        (tmp_path / "getting-started").mkdir()
+        concepts = tmp_path / "getting-started" / "concepts.md"
+        concepts.write_text("Concepts about parent_id.", encoding="utf-8")
+        
+        first = load_all_docs(500)
+        assert load_all_docs(500) is first
+        assert "Concepts about parent_id." in first
+        
+        relevant = docs_loader.load_relevant_docs_for_requirement("process data", 500)
+        assert docs_loader.load_relevant_docs_for_requirement("process data", 500) is relevant
+        
+        concepts.write_text("Updated concepts.", encoding="utf-8")
+        stat_result = concepts.stat()
+        os.utime(concepts, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+        assert "Updated concepts." in load_all_docs(500)
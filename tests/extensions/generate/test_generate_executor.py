@@ -27,6 +27,58 @@ class TestGenerateExecutor:
         assert "requirement" in schema["required"]
         assert "requirement" in schema["properties"]
     
+    def test_build_llm_prompt(self):
+        """Test prompt includes requirement and optional user_id note"""
+        from aipartnerupflow.extensions.generate.generate_executor import _get_executors_section
+        executor = GenerateExecutor()
+        _get_executors_section.cache_clear()
+        with patch(
+            "aipartnerupflow.extensions.generate.generate_executor.format_executors_for_llm",
+            return_value="ID: system_info_executor"
+        ):
+            prompt = executor._build_llm_prompt("Collect CPU stats", "user42")
+            prompt_without_user = executor._build_llm_prompt("Collect CPU stats")
+
+        assert prompt.startswith("You are an expert task tree generator")
+        assert "=== Business Requirement ===\nCollect CPU stats\n" in prompt
+        assert "ID: system_info_executor" in prompt
+        assert '"name": "Fetch API Data"' in prompt
+        assert "Note: Use user_id='user42' for all generated tasks." in prompt
+        assert "Note: Use user_id=" not in prompt_without_user
+        assert prompt.endswith("Now generate the task tree JSON array based on the requirement above.")
+        _get_executors_section.cache_clear()
+
+    def test_prompt_example_json_is_valid(self):
+        """Test the pre-formatted example in the prompt is valid, canonical JSON"""
+        from aipartnerupflow.extensions.generate.generate_executor import _EXAMPLE_JSON
+        example = json.loads(_EXAMPLE_JSON)
+        assert json.dumps(example, indent=2) == _EXAMPLE_JSON
+        # The example must itself be a valid task tree
+        executor = GenerateExecutor()
+        assert executor._validate_tasks_array(example)["valid"]
+
+    def test_build_llm_prompt_reuses_executor_info(self):
+        """Test executor info is collected once per registry state"""
+        from aipartnerupflow.extensions.generate.generate_executor import _get_executors_section
+        executor = GenerateExecutor()
+        _get_executors_section.cache_clear()
+        with patch(
+            "aipartnerupflow.extensions.generate.generate_executor.format_executors_for_llm",
+            return_value="ID: system_info_executor"
+        ) as mock_format:
+            executor._build_llm_prompt("Collect CPU stats")
+            executor._build_llm_prompt("Collect memory stats")
+            assert mock_format.call_count == 1
+
+            # A registry change rebuilds the executor info
+            with patch(
+                "aipartnerupflow.extensions.generate.generate_executor.get_registry"
+            ) as mock_registry:
+                mock_registry.return_value.list_executors.return_value = [object()]
+                executor._build_llm_prompt("Collect CPU stats")
+            assert mock_format.call_count == 2
+        _get_executors_section.cache_clear()
+
     def test_parse_llm_response_valid_json(self):
         """Test parsing valid JSON response"""
         executor = GenerateExecutor()
@@ -44,6 +96,47 @@ class TestGenerateExecutor:
         assert isinstance(tasks, list)
         assert len(tasks) == 1
     
+    def test_parse_llm_response_surrounded_by_prose(self):
+        """Test parsing JSON array surrounded by prose and other code fences"""
+        executor = GenerateExecutor()
+        response = (
+            "Install first:\n```bash\npip install x\n```\n"
+            "Here is the tree:\n```json\n[{\"name\": \"a [b] \\\"c\\\"\"}]\n```\nDone."
+        )
+        tasks = executor._parse_llm_response(response)
+        assert tasks == [{"name": "a [b] \"c\""}]
+
+    def test_parse_llm_response_fenced_array_between_bracketed_text(self):
+        """Test a fenced array is found when the response also starts and ends with brackets"""
+        executor = GenerateExecutor()
+        response = '[Response]\n```json\n[{"name": "a"}]\n```\n[End]'
+        tasks = executor._parse_llm_response(response)
+        assert tasks == [{"name": "a"}]
+
+    def test_parse_llm_response_brackets_after_array(self):
+        """Test brackets in trailing prose don't break parsing"""
+        executor = GenerateExecutor()
+        response = 'Result: [{"name": "task ]"}]\nSee note [1].'
+        tasks = executor._parse_llm_response(response)
+        assert tasks == [{"name": "task ]"}]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_parse_llm_response_json_backends(self, use_orjson, monkeypatch):
+        """Test parsing gives the same result with and without orjson"""
+        from aipartnerupflow.extensions.generate import generate_executor as module
+        if use_orjson and module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(module, "orjson", None)
+
+        executor = GenerateExecutor()
+        # NaN is rejected by orjson but accepted by json, so it must still parse
+        tasks = executor._parse_llm_response('[{"name": "a", "priority": 1, "score": NaN}]')
+        assert tasks[0]["name"] == "a"
+        assert tasks[0]["priority"] == 1
+        with pytest.raises(ValueError, match="Failed to parse JSON"):
+            executor._parse_llm_response("[not json]")
+
     def test_parse_llm_response_invalid_json(self):
         """Test parsing invalid JSON raises error"""
         executor = GenerateExecutor()
@@ -172,7 +265,44 @@ class TestGenerateExecutor:
         result = executor._validate_tasks_array(tasks)
         assert not result["valid"]
         assert "parent_id" in result["error"].lower()
-    
+
+    def test_validate_tasks_array_long_sequential_chain(self):
+        """Test validation of a chain deeper than the recursion limit"""
+        executor = GenerateExecutor()
+        tasks = [{"id": "task_0", "name": "step_0"}] + [
+            {
+                "id": f"task_{i}",
+                "name": f"step_{i}",
+                "parent_id": f"task_{i - 1}",
+                "dependencies": [{"id": f"task_{i - 1}", "required": True}]
+            }
+            for i in range(1, 3000)
+        ]
+        result = executor._validate_tasks_array(tasks)
+        assert result["valid"], result["error"]
+
+        # Break the chain with a cycle that is detached from the root
+        tasks[1500]["parent_id"] = "task_1501"
+        result = executor._validate_tasks_array(tasks)
+        assert not result["valid"]
+        assert "not reachable from root" in result["error"]
+
+    def test_validate_tasks_array_parent_error_reported_before_dependency_error(self):
+        """Test invalid parent_id on a later task takes precedence over an earlier invalid dependency"""
+        executor = GenerateExecutor()
+        tasks = [
+            {"name": "executor1", "dependencies": [{"name": "missing_dep"}]},
+            {"name": "executor2", "parent_id": "missing_parent"}
+        ]
+        result = executor._validate_tasks_array(tasks)
+        assert not result["valid"]
+        assert "missing_parent" in result["error"]
+
+        tasks[1]["parent_id"] = "executor1"
+        result = executor._validate_tasks_array(tasks)
+        assert not result["valid"]
+        assert "missing_dep" in result["error"]
+
     @pytest.mark.asyncio
     async def test_execute_missing_requirement(self):
         """Test execute fails without requirement"""